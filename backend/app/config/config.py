@@ -1,6 +1,8 @@
 import os
 from pathlib import Path
 
+from sqlalchemy.engine import make_url
+
 
 BASE_DIR = Path(__file__).resolve().parents[2]
 DEFAULT_INSTANCE_DIR = BASE_DIR / "instance"
@@ -34,6 +36,17 @@ def _build_database_uri() -> str:
     return f"sqlite:///{DEFAULT_DB_PATH.as_posix()}"
 
 
+def _build_engine_options(db_url: str) -> dict:
+    # Batch multi-row INSERTs; SQLAlchemy still caps each batch at the
+    # dialect's bound-parameter limit.
+    options = {"insertmanyvalues_page_size": 10000}
+
+    if make_url(db_url).get_driver_name() == "psycopg2":
+        options["executemany_mode"] = "values_plus_batch"
+
+    return options
+
+
 class Config:
     # =========================
     # BASIC APP CONFIG
@@ -46,6 +59,8 @@ class Config:
     # =========================
     SQLALCHEMY_DATABASE_URI = _build_database_uri()
 
+    SQLALCHEMY_ENGINE_OPTIONS = _build_engine_options(SQLALCHEMY_DATABASE_URI)
+
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
     # =========================
@@ -1,3 +1,38 @@
+from contextlib import contextmanager
+
 from flask_sqlalchemy import SQLAlchemy
 
 db = SQLAlchemy()
+
+
+@contextmanager
+def transactional_ddl(conn):
+    """Run a block of DDL/DML on ``conn`` as one real transaction.
+
+    With its default transaction handling, pysqlite only opens a transaction
+    before INSERT/UPDATE/DELETE, so CREATE/ALTER/DROP statements inside
+    ``conn.begin()`` commit one by one. On SQLite this switches the driver
+    connection to manual mode for the duration and emits an explicit BEGIN,
+    so the whole block commits or rolls back together.
+
+    Other dialects just use ``conn.begin()``. Note that MySQL implicitly
+    commits every DDL statement, so DDL there can never be made atomic.
+    """
+    if conn.dialect.name != "sqlite":
+        with conn.begin():
+            yield conn
+        return
+
+    # Finish any autobegun (e.g. pragma) work before switching modes
+    if conn.in_transaction():
+        conn.commit()
+
+    driver_connection = conn.connection.driver_connection
+    previous_isolation_level = driver_connection.isolation_level
+    driver_connection.isolation_level = None
+    try:
+        with conn.begin():
+            conn.exec_driver_sql("BEGIN")
+            yield conn
+    finally:
+        driver_connection.isolation_level = previous_isolation_level
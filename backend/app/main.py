@@ -1,3 +1,5 @@
+import functools
+
 from flask import Flask, jsonify
 from flask_cors import CORS
 
@@ -75,3 +77,13 @@ def create_app():
         return jsonify({"status": "OK", "security": "Hybrid PQ-PKI Active"})
 
     return app
+
+
+@functools.lru_cache(maxsize=1)
+def get_or_create_app():
+    """Return a process-wide app instance, creating it on first use.
+
+    Maintenance scripts chained in one process share this instance so the
+    engine, RBAC bootstrap and CA initialization only run once.
+    """
+    return create_app()
@@ -337,13 +337,18 @@ class BackupService:
     @staticmethod
     def get_backup_statistics() -> Dict[str, Any]:
         """Get backup statistics."""
-        total_backups = Backup.query.count()
-        successful_backups = Backup.query.filter_by(status="success").count()
-        failed_backups = Backup.query.filter_by(status="failed").count()
-        
-        total_size = db.session.query(
-            db.func.sum(Backup.backup_size)
-        ).filter(Backup.status == "success").scalar() or 0
+        # Aggregate counts and size in a single round-trip
+        total_backups, successful_backups, failed_backups, total_size = db.session.query(
+            db.func.count(Backup.id),
+            db.func.sum(db.case((Backup.status == "success", 1), else_=0)),
+            db.func.sum(db.case((Backup.status == "failed", 1), else_=0)),
+            db.func.sum(
+                db.case((Backup.status == "success", Backup.backup_size), else_=None)
+            ),
+        ).one()
+        successful_backups = successful_backups or 0
+        failed_backups = failed_backups or 0
+        total_size = total_size or 0
         
         latest_backup = Backup.query.filter_by(status="success").order_by(
             Backup.created_at.desc()
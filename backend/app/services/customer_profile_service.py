@@ -3,9 +3,13 @@ Customer Profile Service
 Handles profile viewing and updating for customer role only.
 """
 import json
-from typing import Dict, Optional
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
 from flask import current_app
-from sqlalchemy import func
+from sqlalchemy import event, func
+from sqlalchemy.orm import Session, joinedload
 from app.models.user_model import User
 from app.models.customer_model import Customer
 from app.models.role_model import Role
@@ -16,6 +20,23 @@ from app.security.request_audit_store import RequestAuditStore
 class CustomerProfileService:
     """Service for customer profile management."""
 
+    # Small per-process LRU of assembled profiles, keyed by database URL and
+    # lookup id. Any ORM commit touching User, Customer or Role clears it (see
+    # the session hooks below); the TTL bounds staleness from changes made
+    # outside this process's ORM session (other workers, raw SQL scripts).
+    PROFILE_CACHE_TTL_SECONDS = 30
+    PROFILE_CACHE_MAX_ENTRIES = 1024
+    _PROFILE_CACHE: "OrderedDict[Tuple[str, str], Tuple[float, Dict]]" = OrderedDict()
+    _PROFILE_CACHE_LOCK = threading.Lock()
+    _PROFILE_CACHE_GENERATION = 0
+
+    @staticmethod
+    def invalidate_profile_cache() -> None:
+        """Drop every cached profile."""
+        with CustomerProfileService._PROFILE_CACHE_LOCK:
+            CustomerProfileService._PROFILE_CACHE.clear()
+            CustomerProfileService._PROFILE_CACHE_GENERATION += 1
+
     @staticmethod
     def get_profile(user_id) -> Dict:
         """
@@ -23,8 +44,35 @@ class CustomerProfileService:
         Returns both User and Customer data merged.
         user_id can be either integer (User ID) or string (Customer ID)
         """
-        # Convert to string for customer lookup
-        customer_id = str(user_id)
+        cache = CustomerProfileService._PROFILE_CACHE
+        lookup_id = str(user_id)
+        # Apps bound to different databases must not share entries
+        cache_key = (str(db.engine.url), lookup_id)
+        now = time.time()
+
+        with CustomerProfileService._PROFILE_CACHE_LOCK:
+            cached = cache.get(cache_key)
+            if cached and now - cached[0] < CustomerProfileService.PROFILE_CACHE_TTL_SECONDS:
+                cache.move_to_end(cache_key)
+                return dict(cached[1])
+            generation = CustomerProfileService._PROFILE_CACHE_GENERATION
+
+        profile_data = CustomerProfileService._load_profile(lookup_id)
+
+        with CustomerProfileService._PROFILE_CACHE_LOCK:
+            # Skip the store if an invalidation happened while loading
+            if generation != CustomerProfileService._PROFILE_CACHE_GENERATION:
+                return profile_data
+            cache[cache_key] = (now, dict(profile_data))
+            cache.move_to_end(cache_key)
+            while len(cache) > CustomerProfileService.PROFILE_CACHE_MAX_ENTRIES:
+                cache.popitem(last=False)
+
+        return profile_data
+
+    @staticmethod
+    def _load_profile(customer_id: str) -> Dict:
+        """Resolve the User/Customer rows for a lookup id and build the profile."""
         customer = Customer.query.get(customer_id)
         
         # Try to find user by customer_id first (for customers)
@@ -42,6 +90,34 @@ class CustomerProfileService:
         if not user:
             user = User.query.filter_by(username=str(customer_id)).first()
         
+        return CustomerProfileService._build_profile(user, customer)
+
+    @staticmethod
+    def get_profile_eager(customer_id) -> Dict:
+        """
+        Get customer profile information with a single joined query.
+        Loads the Customer, its linked User and the User's Role together
+        instead of issuing a separate lazy SELECT for each.
+        Falls back to the uncached lookup when no User is linked by customer_id,
+        so both paths always read current data.
+        """
+        customer_id = str(customer_id)
+        row = (
+            db.session.query(Customer, User)
+            .outerjoin(User, User.customer_id == Customer.id)
+            .options(joinedload(User.role))
+            .filter(Customer.id == customer_id)
+            .first()
+        )
+
+        if row is None or row.User is None:
+            return CustomerProfileService._load_profile(customer_id)
+
+        return CustomerProfileService._build_profile(row.User, row.Customer)
+
+    @staticmethod
+    def _build_profile(user: Optional[User], customer: Optional[Customer]) -> Dict:
+        """Merge already-loaded User and Customer rows into a profile dict."""
         # If user record exists, return full profile
         if user:
             # Get role information
@@ -250,3 +326,41 @@ class CustomerProfileService:
                 errors["mobile"] = "Mobile number is too short (min 10 digits)"
         
         return errors
+
+
+# Models whose rows feed the assembled profile
+_PROFILE_MODELS = (User, Customer, Role)
+_PROFILE_DIRTY_KEY = "customer_profile_cache_dirty"
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_profile_cache_dirty(session, flush_context):
+    """Remember whether this transaction wrote any profile-backing rows."""
+    changed = session.new | session.dirty | session.deleted
+    if any(isinstance(obj, _PROFILE_MODELS) for obj in changed):
+        session.info[_PROFILE_DIRTY_KEY] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_profile_cache_dirty_bulk(orm_execute_state):
+    """Catch bulk insert()/update()/delete() statements that bypass flush."""
+    if not (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None and issubclass(mapper.class_, _PROFILE_MODELS):
+        orm_execute_state.session.info[_PROFILE_DIRTY_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_profile_cache_on_commit(session):
+    if session.info.pop(_PROFILE_DIRTY_KEY, False):
+        CustomerProfileService.invalidate_profile_cache()
+
+
+@event.listens_for(Session, "after_rollback")
+def _reset_profile_cache_flag(session):
+    session.info.pop(_PROFILE_DIRTY_KEY, None)
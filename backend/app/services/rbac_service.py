@@ -2,6 +2,8 @@
 RBAC Service
 Handles role and permission management operations.
 """
+from sqlalchemy.orm import selectinload
+
 from app.config.database import db
 from app.models.role_model import Role
 from app.models.permission_model import Permission, RolePermission
@@ -133,7 +135,12 @@ class RBACService:
     @staticmethod
     def get_all_roles_with_permissions():
         """Get all roles with their permissions."""
-        roles = Role.query.order_by(Role.hierarchy_level.desc()).all()
+        # Load every role's permissions in one extra query instead of one per role
+        roles = (
+            Role.query.options(selectinload(Role.permissions))
+            .order_by(Role.hierarchy_level.desc())
+            .all()
+        )
         return [
             {
                 "id": role.id,
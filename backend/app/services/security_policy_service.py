@@ -8,6 +8,8 @@ All changes are logged and validated.
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
+from sqlalchemy import insert
+
 from app.config.database import db
 from app.models.security_policy_model import SecurityPolicy, DEFAULT_POLICIES
 from app.security.security_event_store import SecurityEventStore
@@ -19,23 +21,26 @@ class SecurityPolicyService:
     @staticmethod
     def initialize_default_policies():
         """Initialize default security policies if they don't exist."""
-        for policy_data in DEFAULT_POLICIES:
-            existing = SecurityPolicy.query.filter_by(
-                policy_key=policy_data["policy_key"]
-            ).first()
-            
-            if not existing:
-                policy = SecurityPolicy(
-                    policy_key=policy_data["policy_key"],
-                    policy_value=policy_data["policy_value"],
-                    policy_category=policy_data["policy_category"],
-                    description=policy_data.get("description"),
-                    is_active=True,
-                    updated_by="system",
-                )
-                db.session.add(policy)
+        existing_keys = {
+            key for (key,) in db.session.query(SecurityPolicy.policy_key)
+        }
+        rows = [
+            {
+                "policy_key": policy_data["policy_key"],
+                "policy_value": policy_data["policy_value"],
+                "policy_category": policy_data["policy_category"],
+                "description": policy_data.get("description"),
+                "is_active": True,
+                "updated_by": "system",
+            }
+            for policy_data in DEFAULT_POLICIES
+            if policy_data["policy_key"] not in existing_keys
+        ]
         
         try:
+            if rows:
+                # Single executemany batch instead of one INSERT per policy
+                db.session.execute(insert(SecurityPolicy), rows)
             db.session.commit()
         except Exception as e:
             db.session.rollback()
@@ -0,0 +1,101 @@
+import pytest
+from flask import Flask
+
+from app.config.database import db
+from app.models.customer_model import Customer
+from app.models.role_model import Role
+from app.models.user_model import User
+from app.security.security_event_store import SecurityEventStore
+from app.services.customer_profile_service import CustomerProfileService
+from app.services.incident_response_service import IncidentResponseService
+from app.services.role_service import RoleService
+
+
+@pytest.fixture(name="profile_app")
+def fixture_profile_app(tmp_path, monkeypatch):
+    monkeypatch.setattr(SecurityEventStore, "record", lambda *args, **kwargs: None)
+
+    app = Flask(__name__)
+    db_path = tmp_path / "profiles.db"
+    app.config.update(
+        TESTING=True,
+        SQLALCHEMY_DATABASE_URI=f"sqlite:///{db_path.as_posix()}",
+        SECRET_KEY="test-key",
+    )
+    db.init_app(app)
+
+    with app.app_context():
+        db.create_all()
+        role = Role(name="customer")
+        db.session.add(role)
+        db.session.flush()
+        db.session.add(
+            Customer(id="cust-1", name="Asha Rao", account_number="91-001-TEST0001")
+        )
+        db.session.add(
+            User(
+                username="asha_rao",
+                full_name="Asha Rao",
+                mobile="9000000001",
+                customer_id="cust-1",
+                role_id=role.id,
+                is_active=True,
+            )
+        )
+        db.session.commit()
+        CustomerProfileService.invalidate_profile_cache()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+def test_profile_reflects_account_lock_and_unlock(profile_app):
+    assert CustomerProfileService.get_profile("cust-1")["is_active"] is True
+
+    incident = IncidentResponseService.create_incident(
+        incident_type="suspicious_login",
+        severity="high",
+        description="Repeated failed logins",
+    )
+    IncidentResponseService.lock_user_account(
+        incident["incident_id"], "asha_rao", "sys-admin", "investigation"
+    )
+    assert CustomerProfileService.get_profile("cust-1")["is_active"] is False
+
+    IncidentResponseService.unlock_user_account(
+        incident["incident_id"], "asha_rao", "sys-admin", "cleared"
+    )
+    assert CustomerProfileService.get_profile("cust-1")["is_active"] is True
+
+
+def test_profile_reflects_role_rename(profile_app):
+    assert CustomerProfileService.get_profile("cust-1")["role"] == "customer"
+
+    role = Role.query.filter_by(name="customer").one()
+    RoleService.update_role(role.id, name="retail_customer")
+
+    assert CustomerProfileService.get_profile("cust-1")["role"] == "retail_customer"
+
+
+def test_profile_reflects_profile_update(profile_app):
+    assert CustomerProfileService.get_profile("cust-1")["email"] == ""
+
+    CustomerProfileService.update_profile("cust-1", email="asha@example.com")
+
+    assert CustomerProfileService.get_profile("cust-1")["email"] == "asha@example.com"
+
+
+def test_profile_cache_is_scoped_to_database(profile_app, tmp_path):
+    assert CustomerProfileService.get_profile("cust-1")["full_name"] == "Asha Rao"
+
+    other_app = Flask(__name__)
+    other_app.config.update(
+        TESTING=True,
+        SQLALCHEMY_DATABASE_URI=f"sqlite:///{(tmp_path / 'other.db').as_posix()}",
+    )
+    db.init_app(other_app)
+    with other_app.app_context():
+        db.create_all()
+        with pytest.raises(ValueError):
+            CustomerProfileService.get_profile("cust-1")
+        db.session.remove()
@@ -0,0 +1,143 @@
+import pytest
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.exc import OperationalError
+
+from scripts import remove_email_history as migration
+
+
+def _create_legacy_engine(tmp_path, email_history_sql="email_history TEXT"):
+    engine = create_engine(f"sqlite:///{(tmp_path / 'legacy.db').as_posix()}")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE roles (id INTEGER PRIMARY KEY, name VARCHAR(50))"))
+        conn.execute(text(f"""
+            CREATE TABLE users (
+                id INTEGER PRIMARY KEY,
+                username VARCHAR(100) UNIQUE NOT NULL,
+                full_name VARCHAR(150) NOT NULL,
+                email VARCHAR(150) UNIQUE,
+                mobile VARCHAR(15) NOT NULL,
+                address TEXT,
+                aadhar VARCHAR(12),
+                pan VARCHAR(10),
+                customer_id VARCHAR(64),
+                role_id INTEGER NOT NULL,
+                is_active BOOLEAN DEFAULT 1,
+                created_at DATETIME,
+                {email_history_sql},
+                FOREIGN KEY (role_id) REFERENCES roles(id)
+            )
+        """))
+        conn.execute(text("CREATE INDEX ix_users_email_history ON users(email_history)"))
+        conn.execute(text("INSERT INTO roles (id, name) VALUES (1, 'customer')"))
+        conn.execute(text(
+            "INSERT INTO users (username, full_name, mobile, role_id, email_history) "
+            "VALUES ('asha', 'Asha Rao', '9000000001', 1, '[]')"
+        ))
+    return engine
+
+
+@pytest.fixture(name="legacy_engine")
+def fixture_legacy_engine(tmp_path):
+    engine = _create_legacy_engine(tmp_path)
+    yield engine
+    engine.dispose()
+
+
+def _schema(engine):
+    inspector = inspect(engine)
+    return {
+        "tables": sorted(inspector.get_table_names()),
+        "columns": [col["name"] for col in inspector.get_columns("users")],
+        "indexes": sorted(index["name"] for index in inspector.get_indexes("users")),
+    }
+
+
+def _user_count(engine):
+    with engine.connect() as conn:
+        return conn.execute(text("SELECT COUNT(*) FROM users")).scalar()
+
+
+def test_failed_rebuild_leaves_schema_unchanged(legacy_engine, monkeypatch):
+    before = _schema(legacy_engine)
+    monkeypatch.setattr(migration, "_supports_native_drop_column", lambda conn: False)
+    monkeypatch.setattr(
+        migration, "_RENAME_USERS", text("ALTER TABLE missing_table RENAME TO users")
+    )
+
+    with pytest.raises(OperationalError):
+        migration.drop_email_history_column(legacy_engine)
+
+    assert _schema(legacy_engine) == before
+    assert "users_new" not in before["tables"]
+    assert _user_count(legacy_engine) == 1
+
+
+def test_rebuild_recovers_from_leftover_users_new(legacy_engine, monkeypatch):
+    monkeypatch.setattr(migration, "_supports_native_drop_column", lambda conn: False)
+    with legacy_engine.begin() as conn:
+        conn.execute(text("CREATE TABLE users_new (id INTEGER PRIMARY KEY)"))
+
+    assert migration.drop_email_history_column(legacy_engine) is True
+
+    schema = _schema(legacy_engine)
+    assert "email_history" not in schema["columns"]
+    assert "users_new" not in schema["tables"]
+    assert _user_count(legacy_engine) == 1
+
+
+def test_native_drop_refuses_column_used_by_view(legacy_engine):
+    with legacy_engine.begin() as conn:
+        conn.execute(text("CREATE VIEW user_email_history AS SELECT id, email_history FROM users"))
+    before = _schema(legacy_engine)
+
+    with pytest.raises(RuntimeError, match="view user_email_history"):
+        migration.drop_email_history_column(legacy_engine)
+
+    assert _schema(legacy_engine) == before
+    assert "ix_users_email_history" in before["indexes"]
+
+
+def test_native_drop_falls_back_to_rebuild_for_check_constraint(tmp_path, monkeypatch):
+    # A table-level CHECK naming the column makes SQLite refuse DROP COLUMN
+    engine = _create_legacy_engine(
+        tmp_path,
+        "email_history TEXT, CHECK (email_history IS NULL OR email_history <> '')",
+    )
+    rebuilds = []
+    rebuild = migration._rebuild_users_without_email_history
+    monkeypatch.setattr(
+        migration,
+        "_rebuild_users_without_email_history",
+        lambda conn: rebuilds.append(conn) or rebuild(conn),
+    )
+    try:
+        assert migration.drop_email_history_column(engine) is True
+        assert len(rebuilds) == 1
+
+        schema = _schema(engine)
+        assert "email_history" not in schema["columns"]
+        assert "ix_users_email_history" not in schema["indexes"]
+        assert _user_count(engine) == 1
+    finally:
+        engine.dispose()
+
+
+def test_failed_native_drop_keeps_dropped_indexes(tmp_path, monkeypatch):
+    engine = _create_legacy_engine(
+        tmp_path,
+        "email_history TEXT, CHECK (email_history IS NULL OR email_history <> '')",
+    )
+
+    def failing_rebuild(conn):
+        raise OperationalError("rebuild", {}, Exception("forced failure"))
+
+    monkeypatch.setattr(migration, "_rebuild_users_without_email_history", failing_rebuild)
+    try:
+        before = _schema(engine)
+        with pytest.raises(OperationalError):
+            migration.drop_email_history_column(engine)
+
+        assert _schema(engine) == before
+        assert "ix_users_email_history" in before["indexes"]
+    finally:
+        engine.dispose()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""Mint all local development credentials (admin, manager, auditor) at once.
+
+Running the three bootstrap scripts back-to-back forks a new interpreter for
+each one, re-importing the certificate services and re-initialising the ML-KEM
+backend every time. This wrapper issues all three credentials from a single
+process, so those modules and the Kyber library are loaded once. Only the
+system admin step builds a Flask app, since it resolves roles from the
+database; manager and auditor issuance only reads and writes files on disk.
+
+Each credential uses the defaults (and environment overrides) of its own
+bootstrap script, e.g. SYSTEM_ADMIN_USER_ID, MANAGER_USER_ID, AUDITOR_USER_ID.
+
+Usage (from backend/):
+    python scripts/bootstrap_all.py
+"""
+
+import sys
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+if str(BASE_DIR) not in sys.path:
+    sys.path.insert(0, str(BASE_DIR))
+
+from scripts.bootstrap_auditor_clerk import main as auditor_main  # noqa: E402
+from scripts.bootstrap_manager import main as manager_main  # noqa: E402
+from scripts.bootstrap_system_admin import main as admin_main  # noqa: E402
+
+BOOTSTRAP_STEPS = (
+    ("System Admin", admin_main),
+    ("Manager", manager_main),
+    ("Auditor Clerk", auditor_main),
+)
+
+
+def main() -> None:
+    program = sys.argv[:1]
+
+    for label, bootstrap_main in BOOTSTRAP_STEPS:
+        print(f"Bootstrapping {label}...")
+        # Each bootstrapper parses sys.argv; run it with its own defaults.
+        sys.argv = list(program)
+        bootstrap_main()
+        print()
+
+
+if __name__ == "__main__":
+    main()
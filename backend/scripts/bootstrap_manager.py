@@ -26,6 +26,7 @@ from typing import Optional, Tuple
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import rsa
 from dotenv import load_dotenv
+from flask import has_app_context
 
 BASE_DIR = Path(__file__).resolve().parents[1]
 if str(BASE_DIR) not in sys.path:
@@ -68,7 +69,7 @@ def _resolve_pq_key(value: Optional[str]) -> Optional[str]:
     return value.strip()
 
 
-def main() -> None:
+def _bootstrap() -> None:
     parser = argparse.ArgumentParser(description="Issue a local manager certificate")
     parser.add_argument(
         "--user-id", default=DEFAULT_USER_ID, help="Unique identifier for the manager"
@@ -157,5 +158,19 @@ def main() -> None:
     )
 
 
+def main(app=None) -> None:
+    """Issue the credential; runs inside ``app``'s context when one is passed.
+
+    Issuance only touches key files and the CA material on disk, so a
+    standalone run needs no Flask app at all.
+    """
+    if app is None or has_app_context():
+        _bootstrap()
+        return
+
+    with app.app_context():
+        _bootstrap()
+
+
 if __name__ == "__main__":
     main()
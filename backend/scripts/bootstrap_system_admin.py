@@ -25,6 +25,7 @@ from pathlib import Path
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import rsa
 from dotenv import load_dotenv
+from flask import has_app_context
 
 BASE_DIR = Path(__file__).resolve().parents[1]
 if str(BASE_DIR) not in sys.path:
@@ -56,7 +57,7 @@ def _generate_rsa_spki() -> tuple[bytes, str]:
     return private_pem, public_b64
 
 
-def main() -> None:
+def _bootstrap() -> None:
     parser = argparse.ArgumentParser(
         description="Bootstrap a local system_admin credential"
     )
@@ -139,5 +140,24 @@ def main() -> None:
     )
 
 
+def main(app=None) -> None:
+    """Issue the credential, reusing the caller's app when one is passed in.
+
+    Unlike the manager/auditor bootstrappers, issuance resolves the admin's
+    role through RoleService, so it needs an app context and database.
+    """
+    if has_app_context():
+        _bootstrap()
+        return
+
+    if app is None:
+        from app.main import get_or_create_app
+
+        app = get_or_create_app()
+
+    with app.app_context():
+        _bootstrap()
+
+
 if __name__ == "__main__":
     main()
@@ -22,15 +22,8 @@ def check_role_users():
         print("ROLE USER COUNT CHECK")
         print("=" * 60)
         
-        # Method 1: Using relationship
-        print("\n1. Using Role.users relationship:")
-        roles = db.session.query(Role).all()
-        for role in roles:
-            user_count = len(role.users)
-            print(f"   Role: {role.name:20} (ID: {role.id}) - Users: {user_count}")
-        
-        # Method 2: Using join query (same as RoleService)
-        print("\n2. Using JOIN query (RoleService method):")
+        # Run the JOIN aggregation once (same as RoleService) and derive
+        # every per-role count from it so the methods cannot disagree.
         rows = (
             db.session.query(Role, func.count(User.id).label("user_count"))
             .outerjoin(User, User.role_id == Role.id)
@@ -38,6 +31,15 @@ def check_role_users():
             .order_by(Role.id)
             .all()
         )
+        counts_by_role_id = {role.id: (role.name, user_count) for role, user_count in rows}
+
+        # Method 1: Consistency check against the aggregated counts
+        print("\n1. Role.users consistency check (from aggregated counts):")
+        for role_id, (role_name, user_count) in counts_by_role_id.items():
+            print(f"   Role: {role_name:20} (ID: {role_id}) - Users: {user_count}")
+
+        # Method 2: Using join query (same as RoleService)
+        print("\n2. Using JOIN query (RoleService method):")
         for role, user_count in rows:
             print(f"   Role: {role.name:20} (ID: {role.id}) - Users: {user_count}")
         
@@ -51,15 +53,12 @@ def check_role_users():
         
         # Method 4: Count by role_id
         print("\n4. User count by role_id:")
-        role_counts = (
-            db.session.query(User.role_id, func.count(User.id))
-            .group_by(User.role_id)
-            .all()
-        )
-        for role_id, count in role_counts:
-            role = db.session.query(Role).get(role_id)
-            role_name = role.name if role else "Unknown"
-            print(f"   Role ID {role_id} ({role_name}): {count} users")
+        for role_id, (role_name, user_count) in counts_by_role_id.items():
+            if user_count:
+                print(f"   Role ID {role_id} ({role_name}): {user_count} users")
+        unassigned = len(users) - sum(count for _, count in counts_by_role_id.values())
+        if unassigned:
+            print(f"   Role ID None (Unknown): {unassigned} users")
         
         print("\n" + "=" * 60)
 
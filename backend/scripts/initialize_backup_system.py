@@ -14,12 +14,12 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from app.config.database import db
 from app.models.backup_model import Backup
 from app.services.backup_service import BackupService
-from app.main import create_app
+from app.main import get_or_create_app
 
 
 def initialize_backup_system():
     """Initialize backup system."""
-    app = create_app()
+    app = get_or_create_app()
     
     with app.app_context():
         print("💾 Initializing Backup System...")
@@ -5,11 +5,12 @@ Initializes the Role-Based Access Control system with default roles and permissi
 """
 import sys
 import os
+from collections import defaultdict
 
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from app.main import create_app
+from app.main import get_or_create_app
 from app.services.rbac_service import RBACService
 
 
@@ -19,7 +20,7 @@ def main():
     print("RBAC System Initialization")
     print("=" * 60)
     
-    app = create_app()
+    app = get_or_create_app()
     
     with app.app_context():
         print("\n[1/3] Initializing permissions...")
@@ -44,16 +45,13 @@ def main():
             permissions = RBACService.get_all_permissions()
             
             # Group by resource
-            by_resource = {}
+            by_resource = defaultdict(list)
             for perm in permissions:
-                resource = perm['resource']
-                if resource not in by_resource:
-                    by_resource[resource] = []
-                by_resource[resource].append(perm)
+                by_resource[perm['resource']].append(perm)
             
-            for resource, perms in sorted(by_resource.items()):
+            for resource in sorted(by_resource):
                 print(f"\n  Resource: {resource}")
-                for perm in perms:
+                for perm in by_resource[resource]:
                     print(f"    - {perm['name']} ({perm['action']})")
             
             print("\n" + "=" * 60)
@@ -14,6 +14,9 @@ from app.config.database import db
 from app.models.user_model import User
 from app.models.customer_model import Customer
 
+PROGRESS_INTERVAL = 1000
+
+
 def link_users_to_customers():
     app = create_app()
     
@@ -22,27 +25,33 @@ def link_users_to_customers():
         
         # Get all customers
         customers = Customer.query.all()
-        linked_count = 0
+        linked_mappings = []
+        
+        # Load unlinked users once instead of querying per customer
+        users_by_name = {
+            user.username: user
+            for user in User.query.filter(User.customer_id.is_(None)).all()
+        }
         
         for customer in customers:
             # Try to find user by username (derived from customer name)
-            potential_username = customer.name.lower().replace(" ", "_")[:100]
-            user = User.query.filter_by(username=potential_username).first()
-            
-            # Also try variations
-            if not user:
-                # Try with dots instead of underscores
-                potential_username2 = customer.name.lower().replace(" ", ".")[:100]
-                user = User.query.filter_by(username=potential_username2).first()
+            base_name = customer.name.lower()
+            potential_username = base_name.replace(" ", "_")[:100]
+            # Also try variations: dots instead of underscores
+            potential_username2 = base_name.replace(" ", ".")[:100]
+            user = users_by_name.pop(potential_username, None) or users_by_name.pop(
+                potential_username2, None
+            )
             
-            if user and not user.customer_id:
-                user.customer_id = customer.id
-                linked_count += 1
-                print(f"  ✓ Linked User '{user.username}' to Customer '{customer.name}' (ID: {customer.id})")
+            if user:
+                linked_mappings.append({"id": user.id, "customer_id": customer.id})
+                if len(linked_mappings) % PROGRESS_INTERVAL == 0:
+                    print(f"  … matched {len(linked_mappings)} users so far")
         
-        if linked_count > 0:
+        if linked_mappings:
+            db.session.bulk_update_mappings(User, linked_mappings)
             db.session.commit()
-            print(f"\n✓ Successfully linked {linked_count} users to customers")
+            print(f"\n✓ Successfully linked {len(linked_mappings)} users to customers")
         else:
             print("\n✓ No users needed linking")
 
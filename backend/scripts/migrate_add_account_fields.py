@@ -8,22 +8,22 @@ import os
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from app.config.database import db
-from app.models.customer_model import Customer, AccountType
-from app.main import create_app
+from app.config.database import db, transactional_ddl
+from app.models.customer_model import AccountType
+from app.main import get_or_create_app
 from sqlalchemy import text
 
 
 def migrate_add_account_fields():
     """Add account_type and branch_code columns to customers table."""
-    app = create_app()
+    app = get_or_create_app()
     
     with app.app_context():
         print("🔄 Starting migration: Add account_type and branch_code to customers")
         
         # Check if columns already exist
         inspector = db.inspect(db.engine)
-        columns = [col['name'] for col in inspector.get_columns('customers')]
+        columns = {col['name'] for col in inspector.get_columns('customers')}
         
         needs_migration = False
         
@@ -41,32 +41,33 @@ def migrate_add_account_fields():
         
         if needs_migration:
             try:
-                # Add columns using raw SQL
-                if 'account_type' not in columns:
-                    # SQLite doesn't support ENUM directly, uses TEXT with CHECK constraint
-                    db.session.execute(text(
-                        "ALTER TABLE customers ADD COLUMN account_type VARCHAR(20) DEFAULT 'SAVINGS'"
+                # Add columns and backfill defaults in a single transaction;
+                # transactional_ddl makes SQLite emit a real BEGIN so a failed
+                # backfill also rolls back the new columns
+                with db.engine.connect() as conn, transactional_ddl(conn):
+                    if 'account_type' not in columns:
+                        # SQLite doesn't support ENUM directly, uses TEXT with CHECK constraint
+                        conn.execute(text(
+                            "ALTER TABLE customers ADD COLUMN account_type VARCHAR(20) DEFAULT 'SAVINGS'"
+                        ))
+                        print("  ✓ Added account_type column")
+                    
+                    if 'branch_code' not in columns:
+                        conn.execute(text(
+                            "ALTER TABLE customers ADD COLUMN branch_code VARCHAR(32) DEFAULT 'MUM-HQ'"
+                        ))
+                        print("  ✓ Added branch_code column")
+                    
+                    account_type_result = conn.execute(text(
+                        "UPDATE customers SET account_type = :account_type WHERE account_type IS NULL"
+                    ), {"account_type": AccountType.SAVINGS.name})
+                    branch_code_result = conn.execute(text(
+                        "UPDATE customers SET branch_code = 'MUM-HQ' WHERE branch_code IS NULL"
                     ))
-                    db.session.commit()
-                    print("  ✓ Added account_type column")
-                
-                if 'branch_code' not in columns:
-                    db.session.execute(text(
-                        "ALTER TABLE customers ADD COLUMN branch_code VARCHAR(32) DEFAULT 'MUM-HQ'"
-                    ))
-                    db.session.commit()
-                    print("  ✓ Added branch_code column")
-                
-                # Update existing records with default values
-                customers = Customer.query.all()
-                for customer in customers:
-                    if not hasattr(customer, 'account_type') or customer.account_type is None:
-                        customer.account_type = AccountType.SAVINGS
-                    if not hasattr(customer, 'branch_code') or customer.branch_code is None:
-                        customer.branch_code = 'MUM-HQ'
-                
-                db.session.commit()
-                print(f"  ✓ Updated {len(customers)} existing customer records")
+                print(
+                    f"  ✓ Backfilled account_type on {account_type_result.rowcount} and "
+                    f"branch_code on {branch_code_result.rowcount} existing customer records"
+                )
                 
                 print("✅ Migration completed successfully!")
                 
@@ -10,16 +10,16 @@ import os
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from app.main import create_app
+from app.main import get_or_create_app
 from app.config.database import db
 
 def migrate():
-    app = create_app()
+    app = get_or_create_app()
     
     with app.app_context():
         # Check if column already exists
         inspector = db.inspect(db.engine)
-        columns = [col['name'] for col in inspector.get_columns('users')]
+        columns = {col['name'] for col in inspector.get_columns('users')}
         
         if 'customer_id' in columns:
             print("✓ customer_id column already exists in users table")
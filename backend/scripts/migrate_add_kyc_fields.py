@@ -7,10 +7,9 @@ import sys
 from pathlib import Path
 
 # Add parent directory to path
-sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
-from app.config.database import db
-from app.models.user_model import User
+from app.config.database import db, transactional_ddl
 from sqlalchemy import text
 
 
@@ -21,7 +20,7 @@ def migrate_add_kyc_fields():
     try:
         # Check if columns already exist
         inspector = db.inspect(db.engine)
-        existing_columns = [col['name'] for col in inspector.get_columns('users')]
+        existing_columns = {col['name'] for col in inspector.get_columns('users')}
         
         columns_to_add = []
         
@@ -69,12 +68,12 @@ def migrate_add_kyc_fields():
             print("✅ All KYC fields already exist. No migration needed.")
             return
         
-        # Execute migrations
-        with db.engine.connect() as conn:
+        # Execute migrations in a single transaction; transactional_ddl makes
+        # SQLite emit a real BEGIN so the ALTERs share one commit/fsync
+        with db.engine.connect() as conn, transactional_ddl(conn):
             for sql in columns_to_add:
                 print(f"   Executing: {sql}")
                 conn.execute(text(sql))
-                conn.commit()
         
         print(f"✅ Successfully added {len(columns_to_add)} KYC field(s) to users table")
         
@@ -82,12 +81,15 @@ def migrate_add_kyc_fields():
         from app.models.role_model import Role
         customer_role = Role.query.filter_by(name="customer").first()
         if customer_role:
-            customers = User.query.filter_by(role_id=customer_role.id).all()
-            for customer in customers:
-                if not hasattr(customer, 'kyc_status') or not customer.kyc_status:
-                    customer.kyc_status = 'pending'
+            result = db.session.execute(
+                text(
+                    "UPDATE users SET kyc_status = 'pending' "
+                    "WHERE role_id = :role_id AND (kyc_status IS NULL OR kyc_status = '')"
+                ),
+                {"role_id": customer_role.id},
+            )
             db.session.commit()
-            print(f"✅ Updated {len(customers)} customer(s) with default KYC status")
+            print(f"✅ Updated {result.rowcount} customer(s) with default KYC status")
         
     except Exception as e:
         print(f"❌ Migration failed: {e}")
@@ -96,8 +98,8 @@ def migrate_add_kyc_fields():
 
 
 if __name__ == "__main__":
-    from app.main import app
+    from app.main import get_or_create_app
     
-    with app.app_context():
+    with get_or_create_app().app_context():
         migrate_add_kyc_fields()
         print("✅ KYC fields migration completed successfully!")
@@ -2,9 +2,9 @@
 """One-off migration to add the NOT NULL `purpose` column to `transactions`.
 
 This script is intentionally simple because the project does not yet ship with
-Alembic. It inspects the active database, adds the new column when missing, and
-backfills existing rows with a placeholder so the NOT NULL constraint is
-satisfied.
+Alembic. It inspects the active database and adds the new column when missing; the
+column's DEFAULT fills existing rows with a placeholder so the NOT NULL
+constraint is satisfied.
 
 Usage (from backend/ directory):
     python scripts/migrate_add_purpose_column.py
@@ -30,25 +30,33 @@ from app.config.config import Config  # noqa: E402
 
 MIGRATION_PLACEHOLDER = "Legacy transfer (auto-filled)"
 
+# DEFAULT clauses cannot take bind parameters, so the placeholder is quoted
+# as an SQL string literal once here.
+_PURPOSE_DDL_SQL = (
+    "ALTER TABLE transactions "
+    "ADD COLUMN purpose VARCHAR(256) NOT NULL "
+    "DEFAULT '{}'".format(MIGRATION_PLACEHOLDER.replace("'", "''"))
+)
 
-def _ensure_base_schema() -> None:
-    """Run create_all() so empty sqlite DBs have the latest schema."""
-    from app.main import create_app  # noqa: WPS433 (runtime import by design)
 
-    app = create_app()
-    with app.app_context():
-        pass  # create_app already calls db.create_all()
+def _ensure_base_schema(engine) -> None:
+    """Create the transactions table (and the customers table it references)."""
+    from app.config.database import db  # noqa: WPS433 (runtime import by design)
+    from app.models.customer_model import Customer  # noqa: WPS433
+    from app.models.transaction_model import Transaction  # noqa: WPS433
+
+    db.metadata.create_all(
+        engine, tables=[Customer.__table__, Transaction.__table__], checkfirst=True
+    )
 
 
 def add_purpose_column(engine) -> None:
     inspector = inspect(engine)
-    tables = inspector.get_table_names()
-    if "transactions" not in tables:
+    if not inspector.has_table("transactions"):
         print("[!] transactions table missing. Bootstrapping base schema…")
-        _ensure_base_schema()
+        _ensure_base_schema(engine)
         inspector = inspect(engine)
-        tables = inspector.get_table_names()
-        if "transactions" not in tables:
+        if not inspector.has_table("transactions"):
             raise RuntimeError("transactions table still missing after bootstrap")
 
     column_names = {col["name"] for col in inspector.get_columns("transactions")}
@@ -56,20 +64,10 @@ def add_purpose_column(engine) -> None:
         print("[ok] purpose column already exists. Nothing to do.")
         return
 
-    ddl_sql = (
-        "ALTER TABLE transactions "
-        "ADD COLUMN purpose VARCHAR(256) NOT NULL "
-        f"DEFAULT '{MIGRATION_PLACEHOLDER}'"
-    )
-    backfill = text(
-        "UPDATE transactions SET purpose = :default WHERE purpose IS NULL OR TRIM(purpose) = ''"
-    )
-
+    # The NOT NULL DEFAULT fills every existing row, so no backfill pass is needed.
     with engine.begin() as conn:
         print("[+] Adding purpose column to transactions…")
-        conn.execute(text(ddl_sql))
-        print("[+] Backfilling existing rows…")
-        conn.execute(backfill, {"default": MIGRATION_PLACEHOLDER})
+        conn.execute(text(_PURPOSE_DDL_SQL))
 
     print("[✓] Migration completed. Future transfers must supply a purpose string.")
 
@@ -77,7 +75,7 @@ def add_purpose_column(engine) -> None:
 def main() -> None:
     uri = Config.SQLALCHEMY_DATABASE_URI
     print(f"Using database URI: {uri}")
-    engine = create_engine(uri)
+    engine = create_engine(uri, **Config.SQLALCHEMY_ENGINE_OPTIONS)
     try:
         add_purpose_column(engine)
     except SQLAlchemyError as exc:
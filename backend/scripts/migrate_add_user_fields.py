@@ -11,21 +11,22 @@ import os
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from app.config.database import db
-from app.main import create_app
+from app.config.database import db, transactional_ddl
+from app.models.user_model import User
+from app.main import get_or_create_app
 from sqlalchemy import text
 
 
 def migrate_add_user_fields():
     """Add new fields to users table"""
-    app = create_app()
+    app = get_or_create_app()
     with app.app_context():
         try:
             print("🔄 Starting migration: Add user fields...")
             
             # Check if columns already exist
             inspector = db.inspect(db.engine)
-            existing_columns = [col['name'] for col in inspector.get_columns('users')]
+            existing_columns = {col['name'] for col in inspector.get_columns('users')}
             
             migrations = []
             
@@ -65,30 +66,38 @@ def migrate_add_user_fields():
             else:
                 print("  ℹ 'pan' column already exists")
             
-            # Execute migrations
+            # Make email optional (nullable)
+            # SQLite doesn't support ALTER COLUMN, so we need to check the database type
+            dialect = db.engine.dialect.name
+            email_nullable_sql = None
+            if 'email' in existing_columns and dialect != 'sqlite':
+                if dialect == 'mysql':
+                    email_type = User.__table__.c.email.type.compile(dialect=db.engine.dialect)
+                    email_nullable_sql = f"ALTER TABLE users MODIFY email {email_type} NULL"
+                else:
+                    email_nullable_sql = "ALTER TABLE users ALTER COLUMN email DROP NOT NULL"
+            
+            # Run all DDL in one transaction. On SQLite, transactional_ddl
+            # emits a real BEGIN so the ALTERs commit or roll back together;
+            # MySQL implicitly commits each ALTER, so there a failure can
+            # still leave the table partly migrated (re-running is safe).
+            if migrations or email_nullable_sql:
+                with db.engine.connect() as conn, transactional_ddl(conn):
+                    for migration_sql in migrations:
+                        conn.execute(text(migration_sql))
+                    if email_nullable_sql:
+                        conn.execute(text(email_nullable_sql))
+            
             if migrations:
-                for migration_sql in migrations:
-                    db.session.execute(text(migration_sql))
-                
-                db.session.commit()
                 print(f"\n✅ Successfully added {len(migrations)} new column(s) to users table")
             else:
                 print("\n✅ All columns already exist, no migration needed")
             
-            # Make email optional (nullable)
-            if 'email' in existing_columns:
-                try:
-                    # SQLite doesn't support ALTER COLUMN, so we need to check the database type
-                    if db.engine.dialect.name == 'sqlite':
-                        print("\n  ℹ SQLite detected - email column modification requires table recreation")
-                        print("  ℹ Email will remain as-is for SQLite")
-                    else:
-                        db.session.execute(text("ALTER TABLE users ALTER COLUMN email DROP NOT NULL"))
-                        db.session.commit()
-                        print("\n  ✓ Made email column optional (nullable)")
-                except Exception as e:
-                    print(f"\n  ⚠ Could not modify email column: {e}")
-                    db.session.rollback()
+            if email_nullable_sql:
+                print("\n  ✓ Made email column optional (nullable)")
+            elif 'email' in existing_columns:
+                print("\n  ℹ SQLite detected - email column modification requires table recreation")
+                print("  ℹ Email will remain as-is for SQLite")
             
             print("\n🎉 Migration completed successfully!")
             
@@ -10,36 +10,31 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")
 
 from app.config.database import db
 from app.models.beneficiary_model import Beneficiary
-from app.main import create_app
-from sqlalchemy import text
+from app.main import get_or_create_app
 
 
 def migrate_create_beneficiaries():
     """Create beneficiaries table."""
-    app = create_app()
+    app = get_or_create_app()
     
     with app.app_context():
         try:
             print("🔄 Starting migration: Create beneficiaries table...")
             
             # Check if table already exists
-            inspector = db.inspect(db.engine)
-            tables = inspector.get_table_names()
-            
-            if 'beneficiaries' in tables:
+            if db.inspect(db.engine).has_table('beneficiaries'):
                 print("  ℹ beneficiaries table already exists")
                 print("✅ No migration needed")
                 return
             
-            # Create table
-            db.create_all()
+            # Create only the beneficiaries table
+            Beneficiary.__table__.create(db.engine, checkfirst=True)
             print("  ✓ Created beneficiaries table")
             
             # Verify table was created
             inspector = db.inspect(db.engine)
-            tables = inspector.get_table_names()
             
-            if 'beneficiaries' in tables:
+            if inspector.has_table('beneficiaries'):
                 columns = [col['name'] for col in inspector.get_columns('beneficiaries')]
                 print(f"  ✓ Table verified with {len(columns)} columns:")
                 for col in columns:
@@ -47,6 +42,7 @@ def migrate_create_beneficiaries():
                 print("\n✅ Migration completed successfully!")
             else:
                 print("❌ Table creation failed")
+                return False
                 
         except Exception as e:
             print(f"\n❌ Migration failed: {e}")
@@ -55,4 +51,5 @@ def migrate_create_beneficiaries():
 
 
 if __name__ == "__main__":
-    migrate_create_beneficiaries()
+    if migrate_create_beneficiaries() is False:
+        sys.exit(1)
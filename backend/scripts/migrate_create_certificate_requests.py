@@ -9,19 +9,18 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from app.config.database import db
-from app.main import create_app
+from app.main import get_or_create_app
 from app.models.certificate_request_model import CertificateRequest
 
 
 def migrate_create_certificate_requests():
     """Create certificate_requests table"""
-    app = create_app()
+    app = get_or_create_app()
     
     with app.app_context():
         try:
             # Check if table already exists
-            inspector = db.inspect(db.engine)
-            if "certificate_requests" in inspector.get_table_names():
+            if db.inspect(db.engine).has_table("certificate_requests"):
                 print("✓ Table 'certificate_requests' already exists")
                 return
             
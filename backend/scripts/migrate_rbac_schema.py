@@ -5,102 +5,95 @@ Adds new columns and tables for RBAC system.
 """
 import sys
 import os
-import sqlite3
+
+from sqlalchemy import create_engine, inspect, text
 
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from app.config.config import Config
+from app.models.permission_model import Permission, RolePermission
+
 
+def migrate_database(engine=None):
+    """Migrate database schema for RBAC.
 
-def migrate_database():
-    """Migrate database schema for RBAC."""
-    db_path = Config.SQLALCHEMY_DATABASE_URI.replace("sqlite:///", "")
+    Uses the given engine (e.g. ``db.engine`` from a shared app) when provided;
+    otherwise creates and disposes of a standalone one.
+    """
+    owns_engine = engine is None
+    if owns_engine:
+        engine = create_engine(Config.SQLALCHEMY_DATABASE_URI, **Config.SQLALCHEMY_ENGINE_OPTIONS)
     
     print("=" * 60)
     print("RBAC Database Migration")
     print("=" * 60)
-    print(f"\nDatabase: {db_path}")
+    print(f"\nDatabase: {engine.url.render_as_string(hide_password=True)}")
     
-    if not os.path.exists(db_path):
+    db_path = engine.url.database
+    if engine.dialect.name == "sqlite" and db_path and not os.path.exists(db_path):
         print(f"\n✗ Database file not found: {db_path}")
         print("Please run the application first to create the database.")
         return False
     
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    
     try:
+        inspector = inspect(engine)
+        
         # Check if roles table exists
-        cursor.execute(
-            "SELECT name FROM sqlite_master WHERE type='table' AND name='roles'"
-        )
-        if not cursor.fetchone():
+        if not inspector.has_table("roles"):
             print("\n✗ Roles table not found. Please run the application first.")
             return False
         
         print("\n[1/4] Checking roles table schema...")
         
         # Check if description column exists
-        cursor.execute("PRAGMA table_info(roles)")
-        columns = {row[1] for row in cursor.fetchall()}
+        columns = {col["name"] for col in inspector.get_columns("roles")}
         
-        if "description" not in columns:
-            print("  Adding 'description' column to roles table...")
-            cursor.execute("ALTER TABLE roles ADD COLUMN description VARCHAR(255)")
-            print("  ✓ Added description column")
-        else:
-            print("  ✓ Description column already exists")
-        
-        if "hierarchy_level" not in columns:
-            print("  Adding 'hierarchy_level' column to roles table...")
-            cursor.execute("ALTER TABLE roles ADD COLUMN hierarchy_level INTEGER DEFAULT 1")
-            print("  ✓ Added hierarchy_level column")
-        else:
-            print("  ✓ Hierarchy_level column already exists")
-        
-        print("\n[2/4] Creating permissions table...")
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS permissions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name VARCHAR(100) UNIQUE NOT NULL,
-                resource VARCHAR(100) NOT NULL,
-                action VARCHAR(50) NOT NULL,
-                description VARCHAR(255)
+        with engine.begin() as conn:
+            if "description" not in columns:
+                print("  Adding 'description' column to roles table...")
+                conn.execute(text("ALTER TABLE roles ADD COLUMN description VARCHAR(255)"))
+                print("  ✓ Added description column")
+            else:
+                print("  ✓ Description column already exists")
+            
+            if "hierarchy_level" not in columns:
+                print("  Adding 'hierarchy_level' column to roles table...")
+                conn.execute(text("ALTER TABLE roles ADD COLUMN hierarchy_level INTEGER DEFAULT 1"))
+                print("  ✓ Added hierarchy_level column")
+            else:
+                print("  ✓ Hierarchy_level column already exists")
+            
+            print("\n[2/4] Creating permissions table...")
+            Permission.__table__.create(conn, checkfirst=True)
+            print("  ✓ Permissions table created")
+            
+            print("\n[3/4] Creating role_permissions association table...")
+            RolePermission.__table__.create(conn, checkfirst=True)
+            print("  ✓ Role_permissions table created")
+            
+            print("\n[4/4] Updating existing roles with hierarchy levels...")
+            
+            # Update hierarchy levels for existing roles
+            role_levels = {
+                "customer": (1, "Standard customer with access to own accounts and transactions"),
+                "manager": (2, "Branch manager with approval and oversight capabilities"),
+                "auditor_clerk": (3, "Auditor with read-only access to all system logs and transactions"),
+                "system_admin": (4, "System administrator with full system access and management"),
+            }
+            
+            conn.execute(
+                text(
+                    "UPDATE roles SET hierarchy_level = :level, description = :description "
+                    "WHERE name = :name"
+                ),
+                [
+                    {"level": level, "description": description, "name": role_name}
+                    for role_name, (level, description) in role_levels.items()
+                ],
             )
-        """)
-        print("  ✓ Permissions table created")
-        
-        print("\n[3/4] Creating role_permissions association table...")
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS role_permissions (
-                role_id INTEGER NOT NULL,
-                permission_id INTEGER NOT NULL,
-                PRIMARY KEY (role_id, permission_id),
-                FOREIGN KEY (role_id) REFERENCES roles(id),
-                FOREIGN KEY (permission_id) REFERENCES permissions(id)
-            )
-        """)
-        print("  ✓ Role_permissions table created")
-        
-        print("\n[4/4] Updating existing roles with hierarchy levels...")
-        
-        # Update hierarchy levels for existing roles
-        role_levels = {
-            "customer": (1, "Standard customer with access to own accounts and transactions"),
-            "manager": (2, "Branch manager with approval and oversight capabilities"),
-            "auditor_clerk": (3, "Auditor with read-only access to all system logs and transactions"),
-            "system_admin": (4, "System administrator with full system access and management"),
-        }
-        
-        for role_name, (level, description) in role_levels.items():
-            cursor.execute(
-                "UPDATE roles SET hierarchy_level = ?, description = ? WHERE name = ?",
-                (level, description, role_name)
-            )
-            print(f"  ✓ Updated {role_name} (level {level})")
-        
-        conn.commit()
+            for role_name, (level, _) in role_levels.items():
+                print(f"  ✓ Updated {role_name} (level {level})")
         
         print("\n" + "=" * 60)
         print("Migration Completed Successfully!")
@@ -113,14 +106,14 @@ def migrate_database():
         return True
         
     except Exception as e:
-        conn.rollback()
         print(f"\n✗ Migration failed: {e}")
         import traceback
         traceback.print_exc()
         return False
         
     finally:
-        conn.close()
+        if owns_engine:
+            engine.dispose()
 
 
 if __name__ == "__main__":
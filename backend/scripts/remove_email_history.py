@@ -6,72 +6,205 @@ Email history feature is being removed - users should only have one email at a t
 
 import sys
 import os
+from contextlib import contextmanager
 
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from app.main import create_app
-from app.config.database import db
+from app.main import get_or_create_app
+from app.config.database import db, transactional_ddl
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+# Statements for the table-rebuild fallback, built once at import time.
+# Copying in primary-key order lets SQLite append to users_new's B-tree.
+_CREATE_USERS_NEW = text("""
+    CREATE TABLE users_new (
+        id INTEGER PRIMARY KEY,
+        username VARCHAR(100) UNIQUE NOT NULL,
+        full_name VARCHAR(150) NOT NULL,
+        email VARCHAR(150) UNIQUE,
+        mobile VARCHAR(15) NOT NULL,
+        address TEXT,
+        aadhar VARCHAR(12),
+        pan VARCHAR(10),
+        customer_id VARCHAR(64),
+        role_id INTEGER NOT NULL,
+        is_active BOOLEAN DEFAULT 1,
+        created_at DATETIME,
+        FOREIGN KEY (role_id) REFERENCES roles(id)
+    )
+""")
+_COPY_USERS = text("""
+    INSERT INTO users_new 
+    (id, username, full_name, email, mobile, address, aadhar, pan, customer_id, role_id, is_active, created_at)
+    SELECT id, username, full_name, email, mobile, address, aadhar, pan, customer_id, role_id, is_active, created_at
+    FROM users
+    ORDER BY id
+""")
+_DROP_STALE_USERS_NEW = text("DROP TABLE IF EXISTS users_new")
+_DROP_USERS = text("DROP TABLE users")
+_RENAME_USERS = text("ALTER TABLE users_new RENAME TO users")
+
 
 def remove_email_history():
     """Remove email_history column from users table."""
-    app = create_app()
+    app = get_or_create_app()
     
     with app.app_context():
-        # Check if column exists
-        inspector = db.inspect(db.engine)
-        columns = [col['name'] for col in inspector.get_columns('users')]
-        
-        if 'email_history' not in columns:
-            print("✓ email_history column does not exist in users table")
-            return
-        
-        print("Removing email_history column from users table...")
+        drop_email_history_column(db.engine)
+
+
+def drop_email_history_column(engine):
+    """Drop users.email_history on ``engine``; returns False if it was absent."""
+    # Check if column exists
+    with engine.connect() as conn:
+        column_exists = _has_email_history_column(conn)
+    
+    if not column_exists:
+        print("✓ email_history column does not exist in users table")
+        return False
+    
+    print("Removing email_history column from users table...")
+    
+    inspector = db.inspect(engine)
+    # Explicit indexes on the column must go before it can be dropped;
+    # SQLite cannot drop a column that carries a UNIQUE constraint at all.
+    column_indexes = [
+        index['name']
+        for index in inspector.get_indexes('users')
+        if 'email_history' in index['column_names']
+    ]
+    column_is_unique = any(
+        'email_history' in constraint['column_names']
+        for constraint in inspector.get_unique_constraints('users')
+    )
+    
+    # Views and triggers reading the column would break either way; stop
+    # before touching anything so they can be updated first.
+    with engine.connect() as conn:
+        dependents = _dependent_schema_objects(conn)
+    if dependents:
+        names = ", ".join(f"{kind} {name}" for kind, name in dependents)
+        raise RuntimeError(
+            f"email_history is still referenced by {names}; drop or update them first"
+        )
+    
+    try:
+        # transactional_ddl makes SQLite emit a real BEGIN, so every statement
+        # below (index drops included) commits or rolls back together
+        with engine.connect() as conn, _bulk_migration_pragmas(conn), transactional_ddl(conn):
+            if _supports_native_drop_column(conn) and not column_is_unique:
+                _drop_column_natively(conn, column_indexes)
+            else:
+                _rebuild_users_without_email_history(conn)
         
-        # SQLite doesn't support DROP COLUMN directly, need to recreate table
-        # But since we're using SQLAlchemy, we can use raw SQL with a workaround
-        try:
-            # For SQLite, we need to recreate the table without the column
-            with db.engine.connect() as conn:
-                # Create a new table without email_history
-                conn.execute(db.text("""
-                    CREATE TABLE users_new (
-                        id INTEGER PRIMARY KEY,
-                        username VARCHAR(100) UNIQUE NOT NULL,
-                        full_name VARCHAR(150) NOT NULL,
-                        email VARCHAR(150) UNIQUE,
-                        mobile VARCHAR(15) NOT NULL,
-                        address TEXT,
-                        aadhar VARCHAR(12),
-                        pan VARCHAR(10),
-                        customer_id VARCHAR(64),
-                        role_id INTEGER NOT NULL,
-                        is_active BOOLEAN DEFAULT 1,
-                        created_at DATETIME,
-                        FOREIGN KEY (role_id) REFERENCES roles(id)
-                    )
-                """))
-                
-                # Copy data from old table to new table
-                conn.execute(db.text("""
-                    INSERT INTO users_new 
-                    (id, username, full_name, email, mobile, address, aadhar, pan, customer_id, role_id, is_active, created_at)
-                    SELECT id, username, full_name, email, mobile, address, aadhar, pan, customer_id, role_id, is_active, created_at
-                    FROM users
-                """))
-                
-                # Drop old table
-                conn.execute(db.text("DROP TABLE users"))
-                
-                # Rename new table to users
-                conn.execute(db.text("ALTER TABLE users_new RENAME TO users"))
-                
-                conn.commit()
-            
-            print("✓ Successfully removed email_history column")
-        except Exception as e:
-            print(f"✗ Error removing email_history column: {e}")
+        print("✓ Successfully removed email_history column")
+        return True
+    except Exception as e:
+        print(f"✗ Error removing email_history column: {e}")
+        raise
+
+
+@contextmanager
+def _bulk_migration_pragmas(conn):
+    """Tune SQLite pragmas for the one-shot rebuild, then restore them.
+
+    foreign_keys and journal_mode cannot change inside a transaction, so this
+    must wrap transactional_ddl(). WAL databases keep their journal mode.
+    """
+    if conn.dialect.name != 'sqlite':
+        yield
+        return
+    
+    previous = {
+        pragma: conn.exec_driver_sql(f"PRAGMA {pragma}").scalar()
+        for pragma in ('foreign_keys', 'journal_mode', 'synchronous', 'cache_size', 'temp_store')
+    }
+    relaxed = {
+        'foreign_keys': 'OFF',
+        'synchronous': 'OFF',
+        # ~100 MB page cache and in-memory temp B-trees for the row copy
+        'cache_size': '-100000',
+        'temp_store': 'MEMORY',
+    }
+    if previous['journal_mode'].lower() != 'wal':
+        relaxed['journal_mode'] = 'MEMORY'
+    
+    for pragma, value in relaxed.items():
+        conn.exec_driver_sql(f"PRAGMA {pragma}={value}")
+    conn.commit()
+    try:
+        yield
+    finally:
+        for pragma in relaxed:
+            conn.exec_driver_sql(f"PRAGMA {pragma}={previous[pragma]}")
+        conn.commit()
+
+
+def _has_email_history_column(conn):
+    """Check for the column without reflecting the whole users table."""
+    if conn.dialect.name == 'sqlite':
+        return conn.exec_driver_sql(
+            "SELECT 1 FROM pragma_table_info('users') WHERE name = 'email_history'"
+        ).fetchone() is not None
+    return 'email_history' in {
+        col['name'] for col in db.inspect(conn).get_columns('users')
+    }
+
+
+def _dependent_schema_objects(conn):
+    """List SQLite views/triggers whose SQL mentions email_history."""
+    if conn.dialect.name != 'sqlite':
+        return []
+    return conn.exec_driver_sql(
+        "SELECT type, name FROM sqlite_master "
+        "WHERE type IN ('view', 'trigger') AND sql LIKE '%email_history%'"
+    ).all()
+
+
+def _drop_column_natively(conn, column_indexes):
+    """ALTER TABLE ... DROP COLUMN, falling back to a rebuild on SQLite.
+
+    SQLite refuses DROP COLUMN when a CHECK or foreign key constraint uses the
+    column; the savepoint undoes the index drops before rebuilding instead.
+    """
+    try:
+        with conn.begin_nested():
+            for index_name in column_indexes:
+                conn.execute(db.text(f'DROP INDEX "{index_name}"'))
+            conn.execute(db.text("ALTER TABLE users DROP COLUMN email_history"))
+    except OperationalError:
+        if conn.dialect.name != 'sqlite':
             raise
+        _rebuild_users_without_email_history(conn)
+
+
+def _supports_native_drop_column(conn):
+    """SQLite gained ALTER TABLE ... DROP COLUMN in 3.35.0."""
+    if conn.dialect.name != 'sqlite':
+        return True
+    version = conn.execute(db.text("SELECT sqlite_version()")).scalar()
+    return tuple(int(part) for part in version.split('.')[:3]) >= (3, 35, 0)
+
+
+def _rebuild_users_without_email_history(conn):
+    """Drop the column on older SQLite by recreating the users table."""
+    # Clear a users_new left behind by an interrupted pre-transactional run
+    conn.execute(_DROP_STALE_USERS_NEW)
+    
+    # Create a new table without email_history
+    conn.execute(_CREATE_USERS_NEW)
+    
+    # Copy data from old table to new table
+    conn.execute(_COPY_USERS)
+    
+    # Drop old table
+    conn.execute(_DROP_USERS)
+    
+    # Rename new table to users
+    conn.execute(_RENAME_USERS)
+
 
 if __name__ == "__main__":
     print("=" * 60)
@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-"""Wrapper to run bootstrap scripts with Flask app context."""
+"""Wrapper to run a single bootstrap script by role name."""
 
 import sys
 from pathlib import Path
@@ -8,26 +8,23 @@ BASE_DIR = Path(__file__).resolve().parents[1]
 if str(BASE_DIR) not in sys.path:
     sys.path.insert(0, str(BASE_DIR))
 
-from app.main import create_app
-
-app = create_app()
-
-with app.app_context():
-    if len(sys.argv) > 1 and sys.argv[1] == "admin":
-        print("Bootstrapping System Admin...")
-        from scripts.bootstrap_system_admin import main as admin_main
-        sys.argv = sys.argv[:1] + sys.argv[2:]  # Remove 'admin' argument
-        admin_main()
-    elif len(sys.argv) > 1 and sys.argv[1] == "manager":
-        print("Bootstrapping Manager...")
-        from scripts.bootstrap_manager import main as manager_main
-        sys.argv = sys.argv[:1] + sys.argv[2:]  # Remove 'manager' argument
-        manager_main()
-    elif len(sys.argv) > 1 and sys.argv[1] == "auditor":
-        print("Bootstrapping Auditor Clerk...")
-        from scripts.bootstrap_auditor_clerk import main as auditor_main
-        sys.argv = sys.argv[:1] + sys.argv[2:]  # Remove 'auditor' argument
-        auditor_main()
-    else:
-        print("Usage: python scripts/run_bootstrap.py [admin|manager|auditor] [options]")
-        sys.exit(1)
+# Manager/auditor issuance is file/crypto-only; the system admin bootstrapper
+# builds the app itself because it resolves roles from the database.
+if len(sys.argv) > 1 and sys.argv[1] == "admin":
+    print("Bootstrapping System Admin...")
+    from scripts.bootstrap_system_admin import main as admin_main
+    sys.argv = sys.argv[:1] + sys.argv[2:]  # Remove 'admin' argument
+    admin_main()
+elif len(sys.argv) > 1 and sys.argv[1] == "manager":
+    print("Bootstrapping Manager...")
+    from scripts.bootstrap_manager import main as manager_main
+    sys.argv = sys.argv[:1] + sys.argv[2:]  # Remove 'manager' argument
+    manager_main()
+elif len(sys.argv) > 1 and sys.argv[1] == "auditor":
+    print("Bootstrapping Auditor Clerk...")
+    from scripts.bootstrap_auditor_clerk import main as auditor_main
+    sys.argv = sys.argv[:1] + sys.argv[2:]  # Remove 'auditor' argument
+    auditor_main()
+else:
+    print("Usage: python scripts/run_bootstrap.py [admin|manager|auditor] [options]")
+    sys.exit(1)
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Run all schema migrations in sequence
+-------------------------------------
+Creates the Flask app once and runs every migration inside a single app
+context, instead of paying app/engine initialization for each script.
+Every migration is idempotent, so re-running this script is safe.
+
+Usage (from backend/ directory):
+    python scripts/run_migrations.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.config.database import db
+from app.main import get_or_create_app
+from scripts.migrate_add_account_fields import migrate_add_account_fields
+from scripts.migrate_add_customer_id import migrate as migrate_add_customer_id
+from scripts.migrate_add_kyc_fields import migrate_add_kyc_fields
+from scripts.migrate_add_purpose_column import add_purpose_column
+from scripts.migrate_add_user_fields import migrate_add_user_fields
+from scripts.migrate_create_beneficiaries import migrate_create_beneficiaries
+from scripts.migrate_create_certificate_requests import (
+    migrate_create_certificate_requests,
+)
+from scripts.migrate_rbac_schema import migrate_database as migrate_rbac_schema
+from scripts.migrate_security_policies import migrate_security_policies
+
+
+def _migrate_rbac_schema():
+    return migrate_rbac_schema(db.engine)
+
+
+def _add_purpose_column():
+    add_purpose_column(db.engine)
+
+
+MIGRATIONS = (
+    ("RBAC schema", _migrate_rbac_schema),
+    ("User fields", migrate_add_user_fields),
+    ("User customer_id", migrate_add_customer_id),
+    ("KYC fields", migrate_add_kyc_fields),
+    ("Customer account fields", migrate_add_account_fields),
+    ("Transaction purpose", _add_purpose_column),
+    ("Beneficiaries table", migrate_create_beneficiaries),
+    ("Certificate requests table", migrate_create_certificate_requests),
+    ("Security policies", migrate_security_policies),
+)
+
+
+def run_migrations():
+    """Run every migration against one shared app instance."""
+    app = get_or_create_app()
+
+    with app.app_context():
+        for index, (label, migration) in enumerate(MIGRATIONS, start=1):
+            print(f"\n[{index}/{len(MIGRATIONS)}] {label}")
+            # Migrations that report failure return False instead of raising
+            if migration() is False:
+                print(f"\n✗ Migration '{label}' failed")
+                return False
+
+    print("\n✅ All migrations completed successfully!")
+    return True
+
+
+if __name__ == "__main__":
+    success = run_migrations()
+    sys.exit(0 if success else 1)
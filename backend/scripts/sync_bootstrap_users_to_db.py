@@ -8,16 +8,16 @@ import os
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from app.main import create_app
+from app.main import get_or_create_app
 from app.config.database import db
 from app.models.user_model import User
 from app.models.role_model import Role
-from sqlalchemy import func
+from sqlalchemy import func, insert, text
 
 
 def sync_bootstrap_users():
     """Add bootstrap users to database if they don't exist"""
-    app = create_app()
+    app = get_or_create_app()
     with app.app_context():
         print("🔄 Starting bootstrap users sync to database...")
         print("=" * 60)
@@ -52,49 +52,54 @@ def sync_bootstrap_users():
         
         added_count = 0
         skipped_count = 0
+        rows_to_insert = []
+        
+        # The roles table is tiny: load it once for lookups
+        roles_map = {
+            role.name.lower(): role
+            for role in db.session.query(Role.id, Role.name)
+        }
+        
+        # Fetch every already-present bootstrap username in one query
+        wanted_usernames = {user_data["username"].lower() for user_data in bootstrap_users}
+        existing_usernames = {
+            username
+            for (username,) in db.session.query(func.lower(User.username))
+            .filter(func.lower(User.username).in_(wanted_usernames))
+            .all()
+        }
         
         for user_data in bootstrap_users:
             # Check if user already exists
-            existing_user = (
-                User.query.filter(
-                    func.lower(User.username) == user_data["username"].lower()
-                )
-                .first()
-            )
-            
-            if existing_user:
+            if user_data["username"].lower() in existing_usernames:
                 print(f"  ℹ User '{user_data['username']}' already exists - skipping")
                 skipped_count += 1
                 continue
             
             # Get role
-            role = (
-                Role.query.filter(
-                    func.lower(Role.name) == user_data["role_name"].lower()
-                )
-                .first()
-            )
+            role = roles_map.get(user_data["role_name"].lower())
             
             if not role:
                 print(f"  ❌ Role '{user_data['role_name']}' not found - skipping user '{user_data['username']}'")
                 continue
             
-            # Create user
-            new_user = User(
-                username=user_data["username"],
-                full_name=user_data["full_name"],
-                email=user_data["email"],
-                mobile=user_data["mobile"],
-                address=user_data["address"],
-                role=role,
-                is_active=True,
+            # Queue user for a single multi-row INSERT
+            rows_to_insert.append(
+                {
+                    "username": user_data["username"],
+                    "full_name": user_data["full_name"],
+                    "email": user_data["email"],
+                    "mobile": user_data["mobile"],
+                    "address": user_data["address"],
+                    "role_id": role.id,
+                    "is_active": True,
+                }
             )
-            
-            db.session.add(new_user)
             print(f"  ✓ Added user '{user_data['username']}' with role '{user_data['role_name']}'")
             added_count += 1
         
-        if added_count > 0:
+        if rows_to_insert:
+            db.session.execute(insert(User), rows_to_insert)
             db.session.commit()
             print(f"\n✅ Successfully added {added_count} bootstrap user(s) to database")
         else:
@@ -108,12 +113,19 @@ def sync_bootstrap_users():
         print("FINAL USER COUNTS BY ROLE:")
         print("=" * 60)
         
-        roles = db.session.query(Role).order_by(Role.id).all()
-        for role in roles:
-            user_count = len(role.users)
-            print(f"  {role.name:20} - {user_count} user(s)")
+        # One grouped query streams the per-role counts; the total is their sum
+        role_counts = db.session.execute(text("""
+            SELECT r.name, COUNT(u.id)
+            FROM roles r
+            LEFT JOIN users u ON u.role_id = r.id
+            GROUP BY r.id, r.name
+            ORDER BY r.id
+        """)).yield_per(100)
+        total_users = 0
+        for role_name, user_count in role_counts:
+            print(f"  {role_name:20} - {user_count} user(s)")
+            total_users += user_count
         
-        total_users = db.session.query(User).count()
         print(f"\n  Total users in database: {total_users}")
         print("=" * 60)
 
@@ -3,47 +3,76 @@
 import sys
 import os
 import sqlite3
+from pathlib import Path
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+BASE_DIR = Path(__file__).resolve().parents[1]
 
-from app.config.config import Config
 
-db_path = Config.SQLALCHEMY_DATABASE_URI.replace("sqlite:///", "")
-conn = sqlite3.connect(db_path)
+def _resolve_db_path() -> Path:
+    """Mirror app.config.config's SQLite path resolution using only the stdlib.
+
+    Importing Config would pull in the app package (and SQLAlchemy) just to
+    read one path.
+    """
+    prefix = "sqlite:///"
+    db_url = os.getenv("DATABASE_URL", "")
+    if db_url.startswith(prefix):
+        path = Path(db_url[len(prefix):])
+        return path if path.is_absolute() else BASE_DIR / path
+    if db_url:
+        sys.exit(f"verify_rbac.py only supports SQLite databases, got: {db_url}")
+
+    instance_dir = Path(os.getenv("INSTANCE_DIR", str(BASE_DIR / "instance")))
+    return instance_dir / "pq_banking.db"
+
+
+db_path = _resolve_db_path()
+
+# Read-only connection: no write locks or journal, safe alongside a writer
+db_uri = db_path.resolve().as_uri() + "?mode=ro"
+conn = sqlite3.connect(db_uri, uri=True, isolation_level=None)
 cursor = conn.cursor()
+cursor.execute("PRAGMA query_only=1")
+cursor.execute("PRAGMA cache_size=-20000")
 
 print("=" * 60)
 print("RBAC System Verification")
 print("=" * 60)
 
-# Count permissions
-cursor.execute("SELECT COUNT(*) FROM permissions")
-perm_count = cursor.fetchone()[0]
-print(f"\n✓ Permissions: {perm_count}")
+# Fetch both totals and every role's permission count in one statement.
+# Totals repeat on each row; with no roles a single row of NULL role fields remains.
+cursor.execute("""
+    WITH p(c) AS (SELECT COUNT(*) FROM permissions),
+         rp_total(c) AS (SELECT COUNT(*) FROM role_permissions),
+         r AS (
+             SELECT r.id, r.name, r.hierarchy_level, r.description,
+                    COUNT(rp.permission_id) AS perm_count
+             FROM roles r
+             LEFT JOIN role_permissions rp ON r.id = rp.role_id
+             GROUP BY r.id, r.name, r.hierarchy_level, r.description
+         )
+    SELECT p.c, rp_total.c, r.name, r.hierarchy_level, r.description, r.perm_count
+    FROM p
+    CROSS JOIN rp_total
+    LEFT JOIN r ON 1
+    ORDER BY r.hierarchy_level DESC
+""")
+rows = cursor.fetchall()
+perm_count, assignment_count = rows[0][:2]
+roles = [row[2:] for row in rows if row[2] is not None]
 
-# Count role-permission assignments
-cursor.execute("SELECT COUNT(*) FROM role_permissions")
-assignment_count = cursor.fetchone()[0]
+print(f"\n✓ Permissions: {perm_count}")
 print(f"✓ Role-Permission Assignments: {assignment_count}")
 
-# List roles
-cursor.execute("SELECT name, hierarchy_level, description FROM roles ORDER BY hierarchy_level DESC")
 print("\n✓ Roles:")
-for row in cursor.fetchall():
-    print(f"  - {row[0]} (Level {row[1]})")
-    print(f"    {row[2]}")
+for name, level, description, _ in roles:
+    print(f"  - {name} (Level {level})")
+    print(f"    {description}")
 
 # Count permissions per role
 print("\n✓ Permissions per Role:")
-cursor.execute("""
-    SELECT r.name, COUNT(rp.permission_id) as perm_count
-    FROM roles r
-    LEFT JOIN role_permissions rp ON r.id = rp.role_id
-    GROUP BY r.id, r.name
-    ORDER BY r.hierarchy_level DESC
-""")
-for row in cursor.fetchall():
-    print(f"  - {row[0]}: {row[1]} permissions")
+for name, _, _, role_perm_count in roles:
+    print(f"  - {name}: {role_perm_count} permissions")
 
 print("\n" + "=" * 60)
 print("RBAC System is Operational!")
@@ -8,18 +8,19 @@ import os
 # Add the backend directory to the path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from app import create_app
-from app.services.customer_profile_service import CustomerProfileService
-
 def test_profile_service():
     """Test the profile service with a sample customer ID"""
-    app = create_app()
+    # Imported here so loading this module doesn't pull in Flask/SQLAlchemy
+    from app.main import get_or_create_app
+    from app.models.customer_model import Customer
+    from app.services.customer_profile_service import CustomerProfileService
+
+    app = get_or_create_app()
     
     with app.app_context():
         try:
             # Test with a sample customer ID (adjust this to match your actual customer ID)
             # You can find customer IDs by checking the customers table
-            from app.models.customer_model import Customer
             
             # Get first customer
             customer = Customer.query.first()
@@ -32,10 +33,10 @@ def test_profile_service():
             print(f"✓ Found customer: {customer.name} (ID: {customer.id})")
             print(f"  Account: {customer.account_number}")
             
-            # Test get_profile
-            print("\n📋 Testing get_profile()...")
+            # Test get_profile_eager
+            print("\n📋 Testing get_profile_eager()...")
             try:
-                profile = CustomerProfileService.get_profile(customer.id)
+                profile = CustomerProfileService.get_profile_eager(customer.id)
                 print("✓ Profile retrieved successfully!")
                 print(f"  User ID: {profile.get('user_id')}")
                 print(f"  Username: {profile.get('username')}")